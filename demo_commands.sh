@@ -41,7 +41,7 @@ echo ""
 
 echo "=== 4. Run tests ==="
 echo ""
-PYTHONPATH=src python3 -m unittest discover -s tests -p "test*.py" -v
+PYTHONPATH=src python3 -m pytest tests -v
 echo ""
 echo ""
 
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import functools
+
 from .registry import RuleRegistry
 from .rules import EncryptionEnabledRule, PublicAclRule, PublicPolicyRule, SecureTransportRule
 
 
+@functools.cache
 def default_registry() -> RuleRegistry:
+    """
+    Return the shared registry of built-in rules.
+
+    The built-in rules are stateless, so the registry is constructed once and
+    cached; mutating the returned registry affects all callers. Use
+    `fresh_default_registry` when a private, mutable registry is needed.
+    """
+    return fresh_default_registry()
+
+
+def fresh_default_registry() -> RuleRegistry:
+    """Return a newly constructed registry of built-in rules."""
     reg = RuleRegistry()
     reg.register(EncryptionEnabledRule())
     reg.register(PublicAclRule())
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 from pathlib import Path
 
+try:  # optional accelerated JSON codec
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from .builtins import default_registry
 from .engine import PolicyEngine
 from .repository import StaticPolicyRepository
@@ -11,51 +17,71 @@ from .serialization import evaluation_result_to_dict, rule_configs_from_dict, sn
 from .types import EvaluationResult
 
 
+_SEP = "─" * 60
+_SUB_SEP = "  " + "─" * 40
+
+
 def _format_result_text(result: EvaluationResult) -> str:
     """Format evaluation result as human-readable text."""
-    lines: list[str] = []
-    sep = "─" * 60
-    lines.append("")
-    lines.append("  SkyWatch Policy Evaluation")
-    lines.append(sep)
+    buf = io.StringIO()
+    w = buf.write
+    w("\n")
+    w("  SkyWatch Policy Evaluation\n")
+    w(_SEP + "\n")
     s = result.stats
-    lines.append(f"  Rules evaluated: {s.rules_evaluated}  |  Rules with errors: {s.rules_failed}  |  Duration: {s.duration_ms} ms")
-    lines.append(f"  Findings: {len(result.findings)}  |  Errors: {len(result.errors)}")
-    lines.append("")
+    w(f"  Rules evaluated: {s.rules_evaluated}  |  Rules with errors: {s.rules_failed}  |  Duration: {s.duration_ms} ms\n")
+    w(f"  Findings: {len(result.findings)}  |  Errors: {len(result.errors)}\n")
+    w("\n")
 
     if result.errors:
-        lines.append("  Errors")
-        lines.append("  " + "─" * 40)
+        w("  Errors\n")
+        w(_SUB_SEP + "\n")
         for e in result.errors:
-            lines.append(f"    [{e.rule_id}] {e.error_code.value}: {e.message}")
-        lines.append("")
+            w(f"    [{e.rule_id}] {e.error_code.value}: {e.message}\n")
+        w("\n")
 
     if not result.findings:
-        lines.append("  No findings.")
-        lines.append("")
-        return "\n".join(lines)
+        w("  No findings.\n")
+        w("\n")
+        # Drop the trailing newline to match "\n".join semantics.
+        return buf.getvalue()[:-1]
 
-    lines.append("  Findings")
-    lines.append("  " + "─" * 40)
+    w("  Findings\n")
+    w(_SUB_SEP + "\n")
     for i, f in enumerate(result.findings, 1):
-        lines.append("")
-        lines.append(f"  [{i}] {f.title}")
-        lines.append(f"      Rule: {f.rule_id}  |  Severity: {f.severity.value}  |  Resource: {f.resource_id}")
-        lines.append(f"      {f.description}")
-        lines.append(f"      Evidence: {f.evidence.summary}")
+        w("\n")
+        w(f"  [{i}] {f.title}\n")
+        w(f"      Rule: {f.rule_id}  |  Severity: {f.severity.value}  |  Resource: {f.resource_id}\n")
+        w(f"      {f.description}\n")
+        w(f"      Evidence: {f.evidence.summary}\n")
         if f.remediation.steps:
-            lines.append("      Remediation:")
+            w("      Remediation:\n")
             for step in f.remediation.steps:
-                lines.append(f"        • {step}")
+                w(f"        • {step}\n")
         if f.remediation.references:
-            lines.append("      References:")
+            w("      References:\n")
             for ref in f.remediation.references:
-                lines.append(f"        {ref}")
-        lines.append("")
+                w(f"        {ref}\n")
+        w("\n")
+
+    w(_SEP + "\n")
+    w("\n")
+    return buf.getvalue()[:-1]
+
+
+def _load_json(path: Path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
 
-    lines.append(sep)
-    lines.append("")
-    return "\n".join(lines)
+def _dump_json(out: dict, *, pretty: bool) -> str:
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) if pretty else 0
+        return orjson.dumps(out, option=option).decode()
+    if pretty:
+        return json.dumps(out, indent=2, ensure_ascii=False, sort_keys=True)
+    return json.dumps(out, ensure_ascii=False)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -84,15 +110,16 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("--pretty", action="store_true", help="Pretty-print output JSON (only with --format json).")
     args = p.parse_args(argv)
 
-    snapshot_data = json.loads(args.snapshot.read_text(encoding="utf-8"))
-    policies_data = json.loads(args.policies.read_text(encoding="utf-8"))
+    snapshot_data = _load_json(args.snapshot)
+    policies_data = _load_json(args.policies)
 
     snapshot = snapshot_from_dict(snapshot_data)
     rule_configs = rule_configs_from_dict(policies_data)
 
+    registry = default_registry()
     engine = PolicyEngine(
-        repository=StaticPolicyRepository(tuple(rule_configs)),
-        registry=default_registry(),
+        repository=StaticPolicyRepository.build(rule_configs, registry),
+        registry=registry,
     )
 
     result = engine.evaluate(snapshot)
@@ -101,10 +128,7 @@ def main(argv: list[str] | None = None) -> int:
         print(_format_result_text(result))
     else:
         out = evaluation_result_to_dict(result)
-        if args.pretty:
-            print(json.dumps(out, indent=2, ensure_ascii=False, sort_keys=True))
-        else:
-            print(json.dumps(out, ensure_ascii=False))
+        print(_dump_json(out, pretty=args.pretty))
     return 0
 
 
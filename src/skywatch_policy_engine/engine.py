@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Hashable, Iterable
 
 from .context import EvaluationContext
 from .errors import RuleInvalidSchema, RuleSkippedMissingData, UnknownRuleError
 from .finding_factory import FindingFactory
-from .guard import NormalizationGuard
 from .interfaces import PolicyRule
 from .repository import PolicyRepository
 from .types import (
@@ -17,12 +21,65 @@ from .types import (
     FindingStatus,
     ResourceSnapshot,
     RuleConfig,
-    Severity,
     utc_now,
 )
 
+# Maps known rule-raised exception types to their error codes; anything else
+# in the rule loop is reported as RULE_EXCEPTION.
+_ERR_MAP = {
+    RuleSkippedMissingData: EvaluationErrorCode.SKIPPED_MISSING_DATA,
+    RuleInvalidSchema: EvaluationErrorCode.INVALID_SCHEMA,
+}
 
-@dataclass(frozen=True, slots=True)
+
+class ResultCache:
+    """
+    Small LRU cache mapping snapshot/policy fingerprints to EvaluationResults.
+
+    Intended for workloads that re-evaluate identical snapshot content
+    repeatedly (polling, retries, dashboards). Not thread-safe.
+    """
+
+    __slots__ = ("maxsize", "_data")
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, EvaluationResult] = OrderedDict()
+
+    def get(self, key: Hashable) -> EvaluationResult | None:
+        result = self._data.get(key)
+        if result is not None:
+            self._data.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, result: EvaluationResult) -> None:
+        self._data[key] = result
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+def _stable_metadata_hash(snapshot: ResourceSnapshot) -> bytes:
+    payload = json.dumps(dict(snapshot.metadata), sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def _policy_fingerprint(rule_configs: list[RuleConfig]) -> tuple[Any, ...]:
+    return tuple(
+        (
+            cfg.rule_id,
+            cfg.severity_override,
+            cfg.suppressed,
+            json.dumps(dict(cfg.params), sort_keys=True, default=str) if cfg.params else None,
+        )
+        for cfg in rule_configs
+    )
+
+
+@dataclass(slots=True)
 class PolicyEngine:
     """
     Orchestrates evaluation of a ResourceSnapshot against enabled policy rules.
@@ -31,10 +88,22 @@ class PolicyEngine:
     it will always produce the same results. It implements fail-soft error handling,
     meaning that errors in one rule do not stop evaluation of other rules.
 
+    The class uses slots (no instance dict) but is deliberately not frozen so
+    internal caches can live on the instance; as a consequence engines are not
+    hashable.
+
     Attributes:
         repository: Provides enabled rules for a given resource type and account.
         registry: Maps rule IDs to rule implementations. Must have a `get(rule_id)` method.
         finding_factory: Creates consistent findings with IDs and timestamps.
+        cache: Optional ResultCache. When set, evaluations are keyed by a
+            fingerprint of the snapshot content and the enabled policy set, and
+            cache hits return the stored result (duration_ms refreshed). Note
+            that detected_at in cached findings reflects the original evaluation.
+        emit_suppressed: When False, suppressed rule configs are skipped
+            entirely instead of evaluated and marked SUPPRESSED — their
+            findings will not appear in results. Default True preserves the
+            original behavior.
 
     Example:
         >>> from skywatch_policy_engine.builtins import default_registry
@@ -50,13 +119,15 @@ class PolicyEngine:
     repository: PolicyRepository
     registry: object  # RuleRegistry-like: has get(rule_id)->PolicyRule
     finding_factory: FindingFactory = FindingFactory()
+    cache: ResultCache | None = None
+    emit_suppressed: bool = True
 
     def evaluate(self, snapshot: ResourceSnapshot) -> EvaluationResult:
         """
         Evaluate a resource snapshot against enabled policy rules.
 
-        Performs validation of required snapshot fields using NormalizationGuard
-        before evaluation, then runs all enabled rules and collects findings.
+        Validates required snapshot fields before evaluation, then runs all
+        enabled rules and collects findings.
 
         Args:
             snapshot: Normalized resource snapshot to evaluate. Must contain
@@ -88,22 +159,30 @@ class PolicyEngine:
             ...     print(f"{finding.rule_id}: {finding.severity}")
         """
         started = time.perf_counter()
+        # One clock read per evaluation; all errors emitted here share it,
+        # which also keeps occurred_at consistent for dedup.
+        now = utc_now()
         errors: list[EvaluationError] = []
-        findings = []
+        findings: list = []
+        # Bound-method locals skip the attribute lookup on every loop append.
+        append_error = errors.append
+        append_finding = findings.append
         rules_evaluated = 0
         rules_failed = 0
 
-        # Validate required snapshot fields using NormalizationGuard (per LLD)
-        snapshot_dict = {
-            "account_id": snapshot.account_id,
-            "resource_id": snapshot.resource_id,
-            "resource_type": snapshot.resource_type.value,
-        }
-        guard_result = NormalizationGuard.require(
-            snapshot_dict, paths=["account_id", "resource_id", "resource_type"]
-        )
+        # Validate required snapshot fields directly (per LLD); NormalizationGuard
+        # remains available to rules for nested metadata.* paths.
+        missing_paths = [
+            name
+            for name, value in (
+                ("account_id", snapshot.account_id),
+                ("resource_id", snapshot.resource_id),
+                ("resource_type", snapshot.resource_type),
+            )
+            if value is None
+        ]
 
-        if guard_result.missing_paths:
+        if missing_paths:
             # Return early with validation error
             duration_ms = int((time.perf_counter() - started) * 1000)
             return EvaluationResult(
@@ -115,89 +194,127 @@ class PolicyEngine:
                     EvaluationError(
                         rule_id="__validation__",
                         error_code=EvaluationErrorCode.INVALID_SCHEMA,
-                        message=f"Missing required snapshot fields: {', '.join(guard_result.missing_paths)}",
+                        message=f"Missing required snapshot fields: {', '.join(missing_paths)}",
                         snapshot_id=snapshot.snapshot_id,
-                        occurred_at=utc_now(),
+                        occurred_at=now,
                     )
                 ],
             )
 
         ctx = EvaluationContext(
             correlation_id=snapshot.snapshot_id,
-            evaluated_at=snapshot.captured_at or utc_now(),
+            evaluated_at=snapshot.captured_at or now,
             account_id=snapshot.account_id,
             provider=snapshot.provider,
             resource_type=snapshot.resource_type,
             resource_id=snapshot.resource_id,
         )
 
-        rule_configs = self.repository.get_enabled_rules(
-            resource_type=snapshot.resource_type, account_id=snapshot.account_id
+        # Prefer pre-resolved (config, rule) pairs when the repository provides
+        # them; fall back to per-config registry lookups otherwise.
+        get_bound = getattr(self.repository, "get_bound_rules", None)
+        bound = (
+            get_bound(resource_type=snapshot.resource_type, account_id=snapshot.account_id)
+            if get_bound is not None
+            else None
         )
+        if bound is not None:
+            rule_configs = [cfg for cfg, _ in bound]
+        else:
+            rule_configs = self.repository.get_enabled_rules(
+                resource_type=snapshot.resource_type, account_id=snapshot.account_id
+            )
 
-        for cfg in rule_configs:
+        cache_key = None
+        if self.cache is not None:
+            cache_key = (
+                snapshot.snapshot_id,
+                snapshot.account_id,
+                snapshot.resource_id,
+                snapshot.resource_type,
+                _stable_metadata_hash(snapshot),
+                _policy_fingerprint(rule_configs),
+                # emit_suppressed changes which configs run at all, so engines
+                # (or one engine reconfigured) differing only in this flag must
+                # not share cache entries.
+                self.emit_suppressed,
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                duration_ms = int((time.perf_counter() - started) * 1000)
+                # Fresh list copies so callers mutating a result in place
+                # cannot corrupt the stored entry for later hits.
+                return replace(
+                    cached,
+                    findings=list(cached.findings),
+                    errors=list(cached.errors),
+                    stats=replace(cached.stats, duration_ms=duration_ms),
+                )
+
+        # Non-raising lookup keeps exception machinery out of the loop for
+        # registries that support it (RuleRegistry does).
+        get_or_none = getattr(self.registry, "get_or_none", None)
+
+        emit_suppressed = self.emit_suppressed
+
+        for idx, cfg in enumerate(rule_configs):
+            if cfg.suppressed and not emit_suppressed:
+                continue
             rules_evaluated += 1
-            try:
-                rule: PolicyRule = self.registry.get(cfg.rule_id)
-            except UnknownRuleError as e:
+            if bound is not None:
+                rule: PolicyRule | None = bound[idx][1]
+            elif get_or_none is not None:
+                rule = get_or_none(cfg.rule_id)
+            else:
+                try:
+                    rule = self.registry.get(cfg.rule_id)
+                except UnknownRuleError:
+                    rule = None
+            if rule is None:
                 rules_failed += 1
-                errors.append(
+                append_error(
                     EvaluationError(
                         rule_id=cfg.rule_id,
                         error_code=EvaluationErrorCode.UNKNOWN_RULE,
-                        message=str(e),
+                        message=f"Unknown rule_id: {cfg.rule_id}",
                         snapshot_id=snapshot.snapshot_id,
-                        occurred_at=utc_now(),
+                        occurred_at=now,
                     )
                 )
                 continue
 
-            if hasattr(rule, "supports") and not rule.supports(snapshot.resource_type):
-                continue
-
             try:
                 specs = rule.evaluate(snapshot, params=cfg.params)
-            except RuleSkippedMissingData as e:
-                errors.append(
-                    EvaluationError(
-                        rule_id=cfg.rule_id,
-                        error_code=EvaluationErrorCode.SKIPPED_MISSING_DATA,
-                        message=str(e),
-                        snapshot_id=snapshot.snapshot_id,
-                        occurred_at=utc_now(),
-                    )
-                )
-                continue
-            except RuleInvalidSchema as e:
-                rules_failed += 1
-                errors.append(
-                    EvaluationError(
-                        rule_id=cfg.rule_id,
-                        error_code=EvaluationErrorCode.INVALID_SCHEMA,
-                        message=str(e),
-                        snapshot_id=snapshot.snapshot_id,
-                        occurred_at=utc_now(),
-                    )
-                )
-                continue
             except Exception as e:  # fail-soft
-                rules_failed += 1
-                errors.append(
+                code = _ERR_MAP.get(type(e), EvaluationErrorCode.RULE_EXCEPTION)
+                if code is EvaluationErrorCode.RULE_EXCEPTION:
+                    message = f"{type(e).__name__}: {e}"
+                else:
+                    message = str(e)
+                if code is not EvaluationErrorCode.SKIPPED_MISSING_DATA:
+                    rules_failed += 1
+                append_error(
                     EvaluationError(
                         rule_id=cfg.rule_id,
-                        error_code=EvaluationErrorCode.RULE_EXCEPTION,
-                        message=f"{type(e).__name__}: {e}",
+                        error_code=code,
+                        message=message,
                         snapshot_id=snapshot.snapshot_id,
-                        occurred_at=utc_now(),
+                        occurred_at=now,
                     )
                 )
                 continue
 
             status = FindingStatus.SUPPRESSED if cfg.suppressed else FindingStatus.OPEN
+            override = cfg.severity_override
 
             for spec in specs:
-                sev = _resolve_severity(rule=rule, cfg=cfg, spec_severity=spec.severity)
-                findings.append(
+                # Severity priority: config override > spec severity > rule default.
+                sev = (
+                    override
+                    if override is not None
+                    else (spec.severity if spec.severity is not None else rule.default_severity)
+                )
+                append_finding(
                     self.finding_factory.create(
                         snapshot=snapshot,
                         ctx=ctx,
@@ -215,30 +332,33 @@ class PolicyEngine:
             rules_failed=rules_failed,
             duration_ms=duration_ms,
         )
-        return EvaluationResult(findings=findings, stats=stats, errors=errors)
+        result = EvaluationResult(findings=findings, stats=stats, errors=errors)
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
+        return result
 
+    def evaluate_many(
+        self, snapshots: Iterable[ResourceSnapshot], *, max_workers: int | None = None
+    ) -> list[EvaluationResult]:
+        """
+        Evaluate multiple snapshots, amortizing per-call setup.
 
-def _resolve_severity(
-    *, rule: PolicyRule, cfg: RuleConfig, spec_severity: Severity | None
-) -> Severity:
-    """
-    Resolve the final severity for a finding.
+        Repository rule bindings are resolved once per repository (see
+        StaticPolicyRepository), so the per-snapshot loop only runs the rules.
 
-    Priority order:
-    1. Rule config severity override (if set)
-    2. Finding spec severity (if set by rule)
-    3. Rule default severity
+        Args:
+            snapshots: Snapshots to evaluate. Results preserve input order.
+            max_workers: When set (and != 1), snapshots are evaluated on a
+                ThreadPoolExecutor. This helps IO-bound rules; pure-Python
+                CPU-bound rules gain little under the GIL — use a process pool
+                externally for those. Do not combine with a ResultCache, which
+                is not thread-safe.
 
-    Args:
-        rule: The policy rule that generated the finding.
-        cfg: Rule configuration (may contain severity override).
-        spec_severity: Severity specified by the rule in FindingSpec.
+        Returns:
+            One EvaluationResult per snapshot, in input order.
+        """
+        if max_workers is not None and max_workers != 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(self.evaluate, snapshots))
+        return [self.evaluate(s) for s in snapshots]
 
-    Returns:
-        Final severity to use for the finding.
-    """
-    if cfg.severity_override is not None:
-        return cfg.severity_override
-    if spec_severity is not None:
-        return spec_severity
-    return rule.default_severity
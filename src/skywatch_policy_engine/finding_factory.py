@@ -1,16 +1,16 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import uuid
 from dataclasses import dataclass
 
 from .context import EvaluationContext
 from .interfaces import FindingSpec
 from .types import (
-    FINDING_ID_NAMESPACE,
-    Evidence,
+    FINDING_ID_NAMESPACE_BYTES,
     Finding,
     FindingStatus,
-    Remediation,
     ResourceSnapshot,
     Severity,
 )
@@ -59,9 +59,7 @@ class FindingFactory:
         status: FindingStatus,
         spec: FindingSpec,
     ) -> Finding:
-        fid = _stable_finding_id(
-            snapshot_id=snapshot.snapshot_id, rule_id=rule_id, finding_key=spec.finding_key
-        )
+        fid = _stable_finding_id(snapshot.snapshot_id, rule_id, spec.finding_key)
         return Finding(
             finding_id=str(fid),
             account_id=snapshot.account_id,
@@ -73,21 +71,28 @@ class FindingFactory:
             status=status,
             title=spec.title,
             description=spec.description,
-            evidence=_ensure_evidence(spec.evidence),
-            remediation=_ensure_remediation(spec.remediation),
+            evidence=spec.evidence,
+            remediation=spec.remediation,
             detected_at=ctx.evaluated_at,
         )
 
-
-def _stable_finding_id(*, snapshot_id: str, rule_id: str, finding_key: str) -> uuid.UUID:
-    name = f"{snapshot_id}|{rule_id}|{finding_key}"
-    return uuid.uuid5(FINDING_ID_NAMESPACE, name)
-
-
-def _ensure_evidence(e: Evidence) -> Evidence:
-    # hook for normalization if needed later
-    return e
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the memoized finding-id cache (for long-running processes)."""
+        _stable_finding_id.cache_clear()
 
 
-def _ensure_remediation(r: Remediation) -> Remediation:
-    return r
+@functools.lru_cache(maxsize=4096)
+def _stable_finding_id(snapshot_id: str, rule_id: str, finding_key: str) -> uuid.UUID:
+    # Equivalent to uuid.uuid5(FINDING_ID_NAMESPACE, f"{sid}|{rid}|{key}") but
+    # hashes the components directly, skipping the intermediate joined string.
+    h = hashlib.sha1(FINDING_ID_NAMESPACE_BYTES)
+    h.update(snapshot_id.encode("utf-8"))
+    h.update(b"|")
+    h.update(rule_id.encode("utf-8"))
+    h.update(b"|")
+    h.update(finding_key.encode("utf-8"))
+    digest = bytearray(h.digest()[:16])
+    digest[6] = (digest[6] & 0x0F) | 0x50  # version 5
+    digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return uuid.UUID(bytes=bytes(digest))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 
 from .errors import UnknownRuleError
@@ -15,6 +16,9 @@ class RuleRegistry:
     lookup by rule_id. This enables the Open/Closed Principle: new rules
     can be added without modifying the engine.
 
+    Rule ids are interned (sys.intern) at registration and lookup so the
+    hot-loop dict lookups compare by pointer identity in the common case.
+
     Attributes:
         _rules: Internal dictionary mapping rule_id -> PolicyRule instance.
 
@@ -36,7 +40,7 @@ class RuleRegistry:
         Note:
             If a rule with the same rule_id already exists, it will be overwritten.
         """
-        self._rules[rule.rule_id] = rule
+        self._rules[sys.intern(rule.rule_id)] = rule
 
     def get(self, rule_id: str) -> PolicyRule:
         """
@@ -52,6 +56,15 @@ class RuleRegistry:
             UnknownRuleError: If no rule with the given rule_id is registered.
         """
         try:
-            return self._rules[rule_id]
+            return self._rules[sys.intern(rule_id)]
         except KeyError as e:
             raise UnknownRuleError(rule_id) from e
+
+    def get_or_none(self, rule_id: str) -> PolicyRule | None:
+        """
+        Retrieve a rule by its ID, or None if it is not registered.
+
+        Non-raising variant of `get` for hot paths and probe-then-handle
+        callers that want to avoid exception overhead on misses.
+        """
+        return self._rules.get(rule_id)
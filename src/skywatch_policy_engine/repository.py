@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
+try:  # optional accelerated JSON parser
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from .errors import UnknownRuleError
+from .interfaces import PolicyRule
 from .serialization import rule_configs_from_dict
 from .types import ResourceType, RuleConfig
 
@@ -16,27 +23,128 @@ class PolicyRepository:
         raise NotImplementedError
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True)
 class StaticPolicyRepository(PolicyRepository):
+    """
+    In-memory repository over a fixed tuple of rule configs.
+
+    When constructed with a registry (see `build`), enabled configs are
+    pre-indexed by ResourceType at construction time by probing each rule's
+    `supports()` once, so `get_enabled_rules` is a single dict lookup instead
+    of a per-evaluation filter + supports() probe in the engine loop.
+    """
+
     rules: tuple[RuleConfig, ...]
+    registry: object | None = None  # RuleRegistry-like: has get(rule_id)->PolicyRule
+    _by_type: dict[ResourceType, tuple[RuleConfig, ...]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _bound: dict[ResourceType, tuple[tuple[RuleConfig, PolicyRule | None], ...]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _enabled: tuple[RuleConfig, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # rules is immutable, so the enabled subset is invariant — filter once.
+        self._enabled = tuple(r for r in self.rules if r.enabled)
+        if self.registry is not None:
+            self._by_type = self._index_by_type()
+            self._bound = self._bind_rules()
+
+    @classmethod
+    def build(
+        cls, rules: Iterable[RuleConfig], registry: object
+    ) -> "StaticPolicyRepository":
+        """Construct a repository pre-indexed by resource type via the registry."""
+        return cls(tuple(rules), registry)
+
+    def _index_by_type(self) -> dict[ResourceType, tuple[RuleConfig, ...]]:
+        by_type: dict[ResourceType, tuple[RuleConfig, ...]] = {}
+        for resource_type in ResourceType:
+            applicable: list[RuleConfig] = []
+            for cfg in self._enabled:
+                try:
+                    rule = self.registry.get(cfg.rule_id)
+                except UnknownRuleError:
+                    # Keep unknown rule ids so the engine can report them fail-soft.
+                    applicable.append(cfg)
+                    continue
+                # Declarative SUPPORTED_TYPES beats a supports() call when the
+                # rule provides it: one set-membership probe per (rule, type).
+                supported = getattr(rule, "SUPPORTED_TYPES", None)
+                if supported is not None:
+                    if resource_type in supported:
+                        applicable.append(cfg)
+                elif rule.supports(resource_type):
+                    applicable.append(cfg)
+            by_type[resource_type] = tuple(applicable)
+        return by_type
+
+    def _bind_rules(
+        self,
+    ) -> dict[ResourceType, tuple[tuple[RuleConfig, PolicyRule | None], ...]]:
+        bound: dict[ResourceType, tuple[tuple[RuleConfig, PolicyRule | None], ...]] = {}
+        for resource_type, cfgs in self._by_type.items():
+            pairs: list[tuple[RuleConfig, PolicyRule | None]] = []
+            for cfg in cfgs:
+                try:
+                    rule = self.registry.get(cfg.rule_id)
+                except UnknownRuleError:
+                    # Bind as None; the engine reports UNKNOWN_RULE fail-soft.
+                    rule = None
+                pairs.append((cfg, rule))
+            bound[resource_type] = tuple(pairs)
+        return bound
 
     def get_enabled_rules(
         self, *, resource_type: ResourceType, account_id: str
     ) -> list[RuleConfig]:
-        # For MVP we ignore resource_type/account_id scoping; caller provides the right set.
-        return [r for r in self.rules if r.enabled]
+        # account_id scoping is ignored for MVP; caller provides the right set.
+        if self._by_type is not None:
+            return list(self._by_type.get(resource_type, ()))
+        return list(self._enabled)
+
+    def get_bound_rules(
+        self, *, resource_type: ResourceType, account_id: str
+    ) -> tuple[tuple[RuleConfig, PolicyRule | None], ...] | None:
+        """
+        Return pre-resolved (config, rule) pairs, or None when the repository
+        was constructed without a registry. An unknown rule_id binds to None.
+        """
+        if self._bound is None:
+            return None
+        return self._bound.get(resource_type, ())
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True)
 class JsonPolicyRepository(PolicyRepository):
+    """
+    Repository backed by a JSON policy file.
+
+    The parsed, enabled rule configs are cached and invalidated by the file's
+    mtime, so unchanged files are read and parsed only once instead of on
+    every evaluation.
+    """
+
     path: Path
+    _cached_mtime_ns: int = field(default=-1, init=False, repr=False, compare=False)
+    _cached: tuple[RuleConfig, ...] = field(default=(), init=False, repr=False, compare=False)
 
     def get_enabled_rules(
         self, *, resource_type: ResourceType, account_id: str
     ) -> list[RuleConfig]:
-        data = json.loads(self.path.read_text(encoding="utf-8"))
-        rules = rule_configs_from_dict(data)
-        return [r for r in rules if r.enabled]
+        mtime_ns = self.path.stat().st_mtime_ns
+        if mtime_ns != self._cached_mtime_ns:
+            if orjson is not None:
+                data = orjson.loads(self.path.read_bytes())
+            else:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            rules = rule_configs_from_dict(data)
+            self._cached = tuple(r for r in rules if r.enabled)
+            self._cached_mtime_ns = mtime_ns
+        return list(self._cached)
 
 
 def ensure_repository(rules: Iterable[RuleConfig] | PolicyRepository) -> PolicyRepository:
@@ -0,0 +1,75 @@
+"""Hot scan loops for the ACL and bucket-policy rules.
+
+The per-grant and per-statement loops dominate evaluate() time for those
+rules, so they live here — self-contained, with no snapshot or FindingSpec
+types in sight — making this module the drop-in point for a compiled
+implementation should one ever be warranted.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Mapping
+
+from .common import PUBLIC_GRANTEE_URIS, normalize_to_list
+
+# Substring semantics match the historical '"READ" in perm.upper()' checks
+# (READ_ACP/WRITE_ACP still count), without the per-grant .upper() allocation.
+_PERM_RE = re.compile(r"READ|WRITE|FULL_CONTROL", re.IGNORECASE)
+
+# Canonical AWS casing plus the common variants, so the usual case is a tuple
+# membership check with no temporary lowercased string per statement.
+_ALLOW_EFFECTS = ("Allow", "allow", "ALLOW")
+
+
+def scan_acl_grants(grants: list[Any]) -> list[Mapping[str, Any]]:
+    """Return the grants that give a public group a sensitive permission."""
+    offending: list[Mapping[str, Any]] = []
+    append = offending.append
+    search = _PERM_RE.search
+    uris = PUBLIC_GRANTEE_URIS
+    for g in grants:
+        # dict fast path covers JSON-deserialized input; the Mapping ABC check
+        # only runs for other mapping types (e.g. MappingProxyType).
+        if type(g) is not dict and not isinstance(g, Mapping):
+            continue
+        # Only strings can match a grantee URI; the guard also keeps
+        # unhashable values (e.g. a nested dict) out of the set probe.
+        uri = g.get("grantee_uri")
+        if type(uri) is str and uri in uris and search(str(g.get("permission", ""))):
+            append(g)
+    return offending
+
+
+def scan_public_statements(statements: list[Any], max_evidence: int) -> list[Mapping[str, Any]]:
+    """Return up to ``max_evidence`` Allow statements with wildcard principals."""
+    public: list[Mapping[str, Any]] = []
+    append = public.append
+    for st in statements:
+        if type(st) is not dict and not isinstance(st, Mapping):
+            continue
+        effect = st.get("effect")
+        if effect not in _ALLOW_EFFECTS and not (
+            isinstance(effect, str) and effect.lower() == "allow"
+        ):
+            continue
+        if not _is_wildcard_principal(st.get("principal")):
+            continue
+        actions = normalize_to_list(st.get("action"))
+        # startswith with a tuple covers both casings of the service prefix
+        # without allocating a lowercased copy of every action string.
+        if not any(isinstance(a, str) and a.startswith(("s3:", "S3:")) for a in actions):
+            continue
+        append(st)
+        if len(public) >= max_evidence:
+            break
+    return public
+
+
+def _is_wildcard_principal(principal: Any) -> bool:
+    # Supports common normalized shapes: "*" (possibly padded) and {"AWS": "*"}.
+    if isinstance(principal, str):
+        return principal.strip() == "*"
+    if type(principal) is dict or isinstance(principal, Mapping):
+        return principal.get("AWS") == "*"
+    return False
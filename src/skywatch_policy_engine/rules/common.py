@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import sys
 from typing import Any, Mapping, Sequence
 
 from ..errors import RuleInvalidSchema, RuleSkippedMissingData
+from ..interfaces import FindingSpec, PolicyRule
+from ..types import ResourceSnapshot
 
 
 def get_required(metadata: Mapping[str, Any], *, rule_id: str, key: str) -> Any:
@@ -33,12 +36,37 @@ def as_bool(value: Any, *, rule_id: str, path: str) -> bool:
     raise RuleInvalidSchema(rule_id, f"Expected boolean at {path}")
 
 
-AWS_ALL_USERS_URI = "http://acs.amazonaws.com/groups/global/AllUsers"
-AWS_AUTH_USERS_URI = "http://acs.amazonaws.com/groups/global/AuthenticatedUsers"
+# Interned so membership checks against snapshot strings can short-circuit on
+# identity before falling back to a character compare.
+AWS_ALL_USERS_URI = sys.intern("http://acs.amazonaws.com/groups/global/AllUsers")
+AWS_AUTH_USERS_URI = sys.intern("http://acs.amazonaws.com/groups/global/AuthenticatedUsers")
+
+PUBLIC_GRANTEE_URIS = frozenset({AWS_ALL_USERS_URI, AWS_AUTH_USERS_URI})
 
 
 def is_public_grantee_uri(uri: str | None) -> bool:
-    return uri in (AWS_ALL_USERS_URI, AWS_AUTH_USERS_URI)
+    return uri in PUBLIC_GRANTEE_URIS
+
+
+def batch_evaluate(
+    rule: PolicyRule,
+    snapshots: Sequence[ResourceSnapshot],
+    *,
+    params: Mapping[str, Any] | None = None,
+) -> list[list[FindingSpec]]:
+    """Evaluate a rule against many snapshots in one tight loop.
+
+    Default implementation behind rules' ``evaluate_many``: binds the evaluate
+    method once and appends per-snapshot spec lists, so fleet scans skip the
+    per-call attribute lookups. Rules with per-call params resolution override
+    ``evaluate_many`` to hoist that too.
+    """
+    evaluate = rule.evaluate
+    out: list[list[FindingSpec]] = []
+    append = out.append
+    for s in snapshots:
+        append(evaluate(s, params=params))
+    return out
 
 
 def normalize_to_list(v: Any) -> list[Any]:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 from ..interfaces import FindingSpec
 from ..types import (
@@ -11,55 +11,64 @@ from ..types import (
     ResourceType,
     Severity,
 )
+from .common import batch_evaluate
+
+# Static finding copy, hoisted so evaluate() only allocates the Evidence.
+_TITLE = "S3 bucket encryption at rest is not enabled"
+_DESCRIPTION = "The bucket is missing encryption-at-rest configuration (SSE-S3 or SSE-KMS)."
+_REMEDIATION = Remediation(
+    summary="Enable default encryption on the bucket.",
+    steps=(
+        "Enable SSE-S3 or SSE-KMS default encryption for the bucket.",
+        "Optionally enforce encryption via a bucket policy to deny unencrypted uploads.",
+    ),
+    references=(
+        "https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucket-encryption.html",
+    ),
+)
 
 
 class EncryptionEnabledRule:
     rule_id = "S3_ENCRYPTION_DISABLED"
     rule_version = "1.0.0"
     default_severity = Severity.HIGH
+    SUPPORTED_TYPES = frozenset({ResourceType.S3_BUCKET})
 
     def supports(self, resource_type: ResourceType) -> bool:
-        return resource_type == ResourceType.S3_BUCKET
+        return resource_type in self.SUPPORTED_TYPES
+
+    def evaluate_many(
+        self, snapshots: Sequence[ResourceSnapshot], *, params: Mapping[str, Any] | None = None
+    ) -> list[list[FindingSpec]]:
+        return batch_evaluate(self, snapshots, params=params)
 
     def evaluate(
         self, snapshot: ResourceSnapshot, *, params: Mapping[str, Any] | None = None
     ) -> list[FindingSpec]:
-        encryption = snapshot.metadata.get("encryption")
-        enabled = None
-        if isinstance(encryption, Mapping):
-            enabled = encryption.get("enabled")
+        view = snapshot._view
+        encryption = view.encryption if view is not None else snapshot.metadata.get("encryption")
+        # dict fast path covers JSON-deserialized input; the Mapping ABC check
+        # only runs for other mapping types.
+        is_map = type(encryption) is dict or isinstance(encryption, Mapping)
+        enabled = encryption.get("enabled") if is_map else None
         # Per LLD baseline, missing encryption config is treated as insecure.
         if enabled is True:
             return []
 
-        obs = []
-        if isinstance(encryption, Mapping) and "enabled" in encryption:
-            obs.append(
-                EvidenceObservation(
-                    path="metadata.encryption.enabled", value=encryption.get("enabled")
-                )
-            )
+        if is_map and "enabled" in encryption:
+            obs = (EvidenceObservation(path="metadata.encryption.enabled", value=enabled),)
         else:
-            obs.append(EvidenceObservation(path="metadata.encryption", value=encryption))
+            obs = (EvidenceObservation(path="metadata.encryption", value=encryption),)
 
         return [
             FindingSpec(
                 finding_key="encryption_disabled",
-                title="S3 bucket encryption at rest is not enabled",
-                description="The bucket is missing encryption-at-rest configuration (SSE-S3 or SSE-KMS).",
+                title=_TITLE,
+                description=_DESCRIPTION,
                 evidence=Evidence(
                     summary="Bucket encryption is disabled or missing.",
                     observations=obs,
                 ),
-                remediation=Remediation(
-                    summary="Enable default encryption on the bucket.",
-                    steps=[
-                        "Enable SSE-S3 or SSE-KMS default encryption for the bucket.",
-                        "Optionally enforce encryption via a bucket policy to deny unencrypted uploads.",
-                    ],
-                    references=[
-                        "https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucket-encryption.html",
-                    ],
-                ),
+                remediation=_REMEDIATION,
             )
         ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 from ..errors import RuleInvalidSchema, RuleSkippedMissingData
 from ..interfaces import FindingSpec
@@ -12,60 +12,63 @@ from ..types import (
     ResourceType,
     Severity,
 )
-from .common import is_public_grantee_uri
+from ._scan import scan_acl_grants
+from .common import batch_evaluate
+
+# Static finding copy, hoisted so evaluate() only allocates the Evidence.
+_TITLE = "S3 bucket is publicly accessible via ACL"
+_DESCRIPTION = "The bucket ACL grants public group access (AllUsers/AuthenticatedUsers)."
+_REMEDIATION = Remediation(
+    summary="Remove public ACL grants and enable Public Access Block.",
+    steps=(
+        "Remove ACL grants to AllUsers and AuthenticatedUsers.",
+        "Enable S3 Block Public Access settings for the bucket/account.",
+    ),
+    references=(
+        "https://docs.aws.amazon.com/AmazonS3/latest/userguide/access-control-block-public-access.html",
+    ),
+)
 
 
 class PublicAclRule:
     rule_id = "S3_PUBLIC_ACL"
     rule_version = "1.0.0"
     default_severity = Severity.HIGH
+    SUPPORTED_TYPES = frozenset({ResourceType.S3_BUCKET})
 
     def supports(self, resource_type: ResourceType) -> bool:
-        return resource_type == ResourceType.S3_BUCKET
+        return resource_type in self.SUPPORTED_TYPES
+
+    def evaluate_many(
+        self, snapshots: Sequence[ResourceSnapshot], *, params: Mapping[str, Any] | None = None
+    ) -> list[list[FindingSpec]]:
+        return batch_evaluate(self, snapshots, params=params)
 
     def evaluate(
         self, snapshot: ResourceSnapshot, *, params: Mapping[str, Any] | None = None
     ) -> list[FindingSpec]:
-        grants = snapshot.metadata.get("acl_grants")
+        view = snapshot._view
+        grants = view.acl_grants if view is not None else snapshot.metadata.get("acl_grants")
         if grants is None:
             raise RuleSkippedMissingData(self.rule_id, ["metadata.acl_grants"])
         if not isinstance(grants, list):
             raise RuleInvalidSchema(self.rule_id, "metadata.acl_grants must be a list")
 
-        offending: list[Mapping[str, Any]] = []
-        for g in grants:
-            if not isinstance(g, Mapping):
-                continue
-            uri = g.get("grantee_uri")
-            perm = str(g.get("permission", "")).upper()
-            if is_public_grantee_uri(uri) and (
-                "READ" in perm or "FULL_CONTROL" in perm or "WRITE" in perm
-            ):
-                offending.append(g)
-
+        offending = scan_acl_grants(grants)
         if not offending:
             return []
 
         return [
             FindingSpec(
                 finding_key="public_acl",
-                title="S3 bucket is publicly accessible via ACL",
-                description="The bucket ACL grants public group access (AllUsers/AuthenticatedUsers).",
+                title=_TITLE,
+                description=_DESCRIPTION,
                 evidence=Evidence(
                     summary="Public ACL grants detected.",
-                    observations=[
+                    observations=(
                         EvidenceObservation(path="metadata.acl_grants", value=offending),
-                    ],
-                ),
-                remediation=Remediation(
-                    summary="Remove public ACL grants and enable Public Access Block.",
-                    steps=[
-                        "Remove ACL grants to AllUsers and AuthenticatedUsers.",
-                        "Enable S3 Block Public Access settings for the bucket/account.",
-                    ],
-                    references=[
-                        "https://docs.aws.amazon.com/AmazonS3/latest/userguide/access-control-block-public-access.html",
-                    ],
+                    ),
                 ),
+                remediation=_REMEDIATION,
             )
         ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 from ..errors import RuleInvalidSchema, RuleSkippedMissingData
 from ..interfaces import FindingSpec
@@ -12,21 +12,50 @@ from ..types import (
     ResourceType,
     Severity,
 )
-from .common import normalize_to_list
+from ._scan import scan_public_statements
+
+# Static finding copy, hoisted so evaluate() only allocates the Evidence.
+_TITLE = "S3 bucket policy allows public access"
+_DESCRIPTION = "The bucket policy contains Allow statements with wildcard principals."
+_REMEDIATION = Remediation(
+    summary="Restrict bucket policy to trusted principals only.",
+    steps=(
+        "Remove wildcard principals from Allow statements.",
+        "Use least-privilege IAM principals (roles/users) and conditions.",
+        "Enable/verify S3 Block Public Access settings (especially RestrictPublicBuckets).",
+    ),
+    references=(
+        "https://docs.aws.amazon.com/AmazonS3/latest/userguide/access-policy-language-overview.html",
+        "https://docs.aws.amazon.com/AmazonS3/latest/userguide/access-control-block-public-access.html",
+    ),
+)
 
 
 class PublicPolicyRule:
     rule_id = "S3_PUBLIC_POLICY"
     rule_version = "1.0.0"
     default_severity = Severity.HIGH
+    SUPPORTED_TYPES = frozenset({ResourceType.S3_BUCKET})
 
     def supports(self, resource_type: ResourceType) -> bool:
-        return resource_type == ResourceType.S3_BUCKET
+        return resource_type in self.SUPPORTED_TYPES
 
     def evaluate(
         self, snapshot: ResourceSnapshot, *, params: Mapping[str, Any] | None = None
     ) -> list[FindingSpec]:
-        policy = snapshot.metadata.get("bucket_policy")
+        return self._evaluate(snapshot, (params or {}).get("max_evidence", 10))
+
+    def evaluate_many(
+        self, snapshots: Sequence[ResourceSnapshot], *, params: Mapping[str, Any] | None = None
+    ) -> list[list[FindingSpec]]:
+        """Batch variant: resolves max_evidence once for the whole fleet."""
+        max_evidence = (params or {}).get("max_evidence", 10)
+        evaluate = self._evaluate
+        return [evaluate(s, max_evidence) for s in snapshots]
+
+    def _evaluate(self, snapshot: ResourceSnapshot, max_evidence: int) -> list[FindingSpec]:
+        view = snapshot._view
+        policy = view.bucket_policy if view is not None else snapshot.metadata.get("bucket_policy")
         if policy is None:
             raise RuleSkippedMissingData(self.rule_id, ["metadata.bucket_policy"])
         if not isinstance(policy, Mapping):
@@ -40,24 +69,16 @@ class PublicPolicyRule:
                 self.rule_id, "metadata.bucket_policy.statements must be a list"
             )
 
-        public_statements: list[Mapping[str, Any]] = []
-        for st in statements:
-            if not isinstance(st, Mapping):
-                continue
-            if str(st.get("effect", "")).lower() != "allow":
-                continue
-            principal = st.get("principal")
-            if not _is_wildcard_principal(principal):
-                continue
-            actions = normalize_to_list(st.get("action"))
-            if not any(isinstance(a, str) and a.lower().startswith("s3:") for a in actions):
-                continue
-            public_statements.append(st)
-
+        # One finding is emitted regardless of how many statements offend, so
+        # the evidence scan is capped instead of walking arbitrarily large
+        # policies (max_evidence, default 10, comes from rule params).
+        public_statements = scan_public_statements(statements, max_evidence)
         if not public_statements:
             return []
 
-        pab = snapshot.metadata.get("public_access_block")
+        pab = view.public_access_block if view is not None else snapshot.metadata.get(
+            "public_access_block"
+        )
         restrict_public_buckets = None
         if isinstance(pab, Mapping):
             restrict_public_buckets = pab.get("restrict_public_buckets")
@@ -67,12 +88,12 @@ class PublicPolicyRule:
         return [
             FindingSpec(
                 finding_key="public_policy",
-                title="S3 bucket policy allows public access",
-                description="The bucket policy contains Allow statements with wildcard principals.",
+                title=_TITLE,
+                description=_DESCRIPTION,
                 severity=severity,
                 evidence=Evidence(
                     summary="Public policy statements detected.",
-                    observations=[
+                    observations=(
                         EvidenceObservation(
                             path="metadata.bucket_policy.statements", value=public_statements
                         ),
@@ -80,30 +101,9 @@ class PublicPolicyRule:
                             path="metadata.public_access_block.restrict_public_buckets",
                             value=restrict_public_buckets,
                         ),
-                    ],
-                ),
-                remediation=Remediation(
-                    summary="Restrict bucket policy to trusted principals only.",
-                    steps=[
-                        "Remove wildcard principals from Allow statements.",
-                        "Use least-privilege IAM principals (roles/users) and conditions.",
-                        "Enable/verify S3 Block Public Access settings (especially RestrictPublicBuckets).",
-                    ],
-                    references=[
-                        "https://docs.aws.amazon.com/AmazonS3/latest/userguide/access-policy-language-overview.html",
-                        "https://docs.aws.amazon.com/AmazonS3/latest/userguide/access-control-block-public-access.html",
-                    ],
+                    ),
                 ),
+                remediation=_REMEDIATION,
             )
         ]
 
-
-def _is_wildcard_principal(principal: Any) -> bool:
-    # Supports common normalized shapes.
-    if principal == "*" or principal == {"AWS": "*"}:
-        return True
-    if isinstance(principal, str) and principal.strip() == "*":
-        return True
-    if isinstance(principal, Mapping) and principal.get("AWS") == "*":
-        return True
-    return False
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 from ..interfaces import FindingSpec
 from ..types import (
@@ -11,20 +11,42 @@ from ..types import (
     ResourceType,
     Severity,
 )
+from .common import batch_evaluate
+
+# Static finding copy, hoisted so evaluate() only allocates the Evidence.
+_TITLE = "S3 bucket policy does not enforce TLS-only access"
+_DESCRIPTION = "The bucket does not appear to require TLS (HTTPS) for access."
+_REMEDIATION = Remediation(
+    summary="Enforce TLS-only access to the bucket.",
+    steps=(
+        "Add a bucket policy statement that denies requests where aws:SecureTransport is false.",
+        "Validate clients access the bucket using HTTPS endpoints.",
+    ),
+    references=(
+        "https://docs.aws.amazon.com/AmazonS3/latest/userguide/example-bucket-policies.html#example-bucket-policies-use-secure-transport",
+    ),
+)
 
 
 class SecureTransportRule:
     rule_id = "S3_TLS_NOT_ENFORCED"
     rule_version = "1.0.0"
     default_severity = Severity.MEDIUM
+    SUPPORTED_TYPES = frozenset({ResourceType.S3_BUCKET})
 
     def supports(self, resource_type: ResourceType) -> bool:
-        return resource_type == ResourceType.S3_BUCKET
+        return resource_type in self.SUPPORTED_TYPES
+
+    def evaluate_many(
+        self, snapshots: Sequence[ResourceSnapshot], *, params: Mapping[str, Any] | None = None
+    ) -> list[list[FindingSpec]]:
+        return batch_evaluate(self, snapshots, params=params)
 
     def evaluate(
         self, snapshot: ResourceSnapshot, *, params: Mapping[str, Any] | None = None
     ) -> list[FindingSpec]:
-        transport = snapshot.metadata.get("transport")
+        view = snapshot._view
+        transport = view.transport if view is not None else snapshot.metadata.get("transport")
         requires_tls = None
         if isinstance(transport, Mapping):
             requires_tls = transport.get("requires_tls")
@@ -36,25 +58,16 @@ class SecureTransportRule:
         return [
             FindingSpec(
                 finding_key="tls_not_enforced",
-                title="S3 bucket policy does not enforce TLS-only access",
-                description="The bucket does not appear to require TLS (HTTPS) for access.",
+                title=_TITLE,
+                description=_DESCRIPTION,
                 evidence=Evidence(
                     summary="TLS is not enforced or the indicator is missing.",
-                    observations=[
+                    observations=(
                         EvidenceObservation(
                             path="metadata.transport.requires_tls", value=requires_tls
                         ),
-                    ],
-                ),
-                remediation=Remediation(
-                    summary="Enforce TLS-only access to the bucket.",
-                    steps=[
-                        "Add a bucket policy statement that denies requests where aws:SecureTransport is false.",
-                        "Validate clients access the bucket using HTTPS endpoints.",
-                    ],
-                    references=[
-                        "https://docs.aws.amazon.com/AmazonS3/latest/userguide/example-bucket-policies.html#example-bucket-policies-use-secure-transport",
-                    ],
+                    ),
                 ),
+                remediation=_REMEDIATION,
             )
         ]
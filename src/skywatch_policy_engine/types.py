@@ -40,6 +40,24 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True, slots=True)
+class S3MetadataView:
+    """Pre-extracted references to the well-known S3 metadata fields.
+
+    Built once per snapshot so rules read a slot instead of re-hashing the
+    same metadata keys on every evaluation. Missing fields are None.
+    """
+
+    acl_grants: Any = None
+    bucket_policy: Any = None
+    encryption: Any = None
+    transport: Any = None
+    public_access_block: Any = None
+
+
 @dataclass(frozen=True, slots=True)
 class ResourceSnapshot:
     """
@@ -66,6 +84,44 @@ class ResourceSnapshot:
     resource_id: str
     captured_at: datetime
     metadata: Mapping[str, Any] = field(default_factory=dict)
+    _view: S3MetadataView | None = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def minimal(
+        cls,
+        *,
+        metadata: Mapping[str, Any],
+        resource_type: ResourceType = ResourceType.S3_BUCKET,
+    ) -> "ResourceSnapshot":
+        """Sentinel-filled snapshot for callers that only care about metadata.
+
+        Handy for negative tests exercising missing-data paths, where the
+        identity fields never influence the outcome.
+        """
+        return cls(
+            snapshot_id="x",
+            account_id="0",
+            provider=Provider.AWS,
+            resource_type=resource_type,
+            resource_id="x",
+            captured_at=_EPOCH,
+            metadata=metadata,
+        )
+
+    def __post_init__(self) -> None:
+        if self.resource_type is ResourceType.S3_BUCKET:
+            md = self.metadata
+            object.__setattr__(
+                self,
+                "_view",
+                S3MetadataView(
+                    acl_grants=md.get("acl_grants"),
+                    bucket_policy=md.get("bucket_policy"),
+                    encryption=md.get("encryption"),
+                    transport=md.get("transport"),
+                    public_access_block=md.get("public_access_block"),
+                ),
+            )
 
 
 @dataclass(frozen=True, slots=True)
@@ -83,17 +139,20 @@ class EvidenceObservation:
     value: Any
 
 
+# Observations/steps/references are tuples: immutable once a finding is
+# emitted, cheaper per element than lists, and safely shareable across
+# findings (the hoisted per-rule Remediation constants rely on this).
 @dataclass(frozen=True, slots=True)
 class Evidence:
     summary: str
-    observations: list[EvidenceObservation] = field(default_factory=list)
+    observations: tuple[EvidenceObservation, ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
 class Remediation:
     summary: str
-    steps: list[str] = field(default_factory=list)
-    references: list[str] = field(default_factory=list)
+    steps: tuple[str, ...] = ()
+    references: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -157,7 +216,29 @@ class EvaluationResult:
     findings: list[Finding]
     stats: EvaluationStats
     errors: list[EvaluationError] = field(default_factory=list)
+    _by_rule: dict[str, tuple[Finding, ...]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def findings_by_rule(self, rule_id: str) -> tuple[Finding, ...]:
+        """Findings for one rule via a hash index built lazily on first use.
+
+        Repeated per-rule scans become O(1) lookups; the index snapshots the
+        findings list at first call, matching the result's read-only intent.
+        """
+        by_rule = self._by_rule
+        if by_rule is None:
+            grouped: dict[str, list[Finding]] = {}
+            for f in self.findings:
+                grouped.setdefault(f.rule_id, []).append(f)
+            by_rule = {k: tuple(v) for k, v in grouped.items()}
+            object.__setattr__(self, "_by_rule", by_rule)
+        return by_rule.get(rule_id, ())
 
 
 # A stable, deterministic namespace for finding IDs.
 FINDING_ID_NAMESPACE = uuid.UUID("3d014e3a-8a03-4dd8-9f5d-6b7b5a03b0d2")
+
+# Pre-extracted namespace bytes for ID generators that hash directly, so hot
+# loops skip the per-call UUID attribute fetch.
+FINDING_ID_NAMESPACE_BYTES: bytes = FINDING_ID_NAMESPACE.bytes
@@ -0,0 +1,19 @@
+import pytest
+
+from skywatch_policy_engine.builtins import default_registry
+from skywatch_policy_engine.rules.public_policy import PublicPolicyRule
+
+
+@pytest.fixture(scope="session")
+def registry():
+    """One shared rule registry for the whole test session."""
+    return default_registry()
+
+
+@pytest.fixture(scope="session")
+def public_policy_rule():
+    # PublicPolicyRule keeps no instance state (evaluate is a pure function of
+    # the snapshot), so one instance safely serves every test in the session —
+    # including parallel collection under pytest-xdist, where each worker
+    # builds it once.
+    return PublicPolicyRule()
@@ -11,8 +11,10 @@ from skywatch_policy_engine.types import (
 
 
 class TestEncryptionRule(unittest.TestCase):
-    def setUp(self):
-        self.rule = EncryptionEnabledRule()
+    @classmethod
+    def setUpClass(cls):
+        # The rule is stateless; one instance serves the whole class.
+        cls.rule = EncryptionEnabledRule()
 
     def test_encryption_enabled_no_finding(self):
         """Should not emit finding when encryption is enabled"""
@@ -42,11 +44,10 @@ class TestEncryptionRule(unittest.TestCase):
         findings = self.rule.evaluate(snapshot)
         self.assertEqual(len(findings), 1)
         # FindingSpec doesn't have severity set (it's None by default, set later by engine)
-        self.assertEqual(
-            findings[0].title, "S3 bucket encryption at rest is not enabled"
-        )
-        self.assertEqual(findings[0].finding_key, "encryption_disabled")
-        self.assertIn("encryption", findings[0].evidence.observations[0].path.lower())
+        f0 = findings[0]
+        self.assertEqual(f0.title, "S3 bucket encryption at rest is not enabled")
+        self.assertEqual(f0.finding_key, "encryption_disabled")
+        self.assertIn("encryption", f0.evidence.observations[0].path.lower())
 
     def test_encryption_missing_emits_finding(self):
         """Should emit finding when encryption config is missing"""
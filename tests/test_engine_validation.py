@@ -17,7 +17,7 @@ class TestEngineValidation(unittest.TestCase):
     def setUp(self):
         self.engine = PolicyEngine(
             repository=StaticPolicyRepository(
-                tuple([RuleConfig(rule_id="S3_ENCRYPTION_DISABLED", enabled=True)])
+                (RuleConfig(rule_id="S3_ENCRYPTION_DISABLED", enabled=True),)
             ),
             registry=default_registry(),
         )
@@ -12,8 +12,10 @@ from skywatch_policy_engine.types import (
 
 
 class TestPublicAclRule(unittest.TestCase):
-    def setUp(self):
-        self.rule = PublicAclRule()
+    @classmethod
+    def setUpClass(cls):
+        # The rule is stateless; one instance serves the whole class.
+        cls.rule = PublicAclRule()
 
     def test_no_public_acl_no_finding(self):
         """Should not emit finding when no public ACL grants exist"""
@@ -58,8 +60,9 @@ class TestPublicAclRule(unittest.TestCase):
         )
         findings = self.rule.evaluate(snapshot)
         self.assertEqual(len(findings), 1)
-        self.assertEqual(findings[0].finding_key, "public_acl")
-        self.assertEqual(findings[0].title, "S3 bucket is publicly accessible via ACL")
+        f0 = findings[0]
+        self.assertEqual(f0.finding_key, "public_acl")
+        self.assertEqual(f0.title, "S3 bucket is publicly accessible via ACL")
 
     def test_public_acl_authenticated_users_emits_finding(self):
         """Should emit finding when AuthenticatedUsers has permission"""
@@ -85,30 +88,14 @@ class TestPublicAclRule(unittest.TestCase):
 
     def test_missing_acl_grants_raises_error(self):
         """Should raise RuleSkippedMissingData when acl_grants is missing"""
-        snapshot = ResourceSnapshot(
-            snapshot_id="test-4",
-            account_id="123456789012",
-            provider=Provider.AWS,
-            resource_type=ResourceType.S3_BUCKET,
-            resource_id="bucket-4",
-            captured_at=datetime.now(timezone.utc),
-            metadata={},  # No acl_grants
-        )
+        snapshot = ResourceSnapshot.minimal(metadata={})  # No acl_grants
         with self.assertRaises(RuleSkippedMissingData) as cm:
             self.rule.evaluate(snapshot)
         self.assertIn("acl_grants", str(cm.exception))
 
     def test_invalid_acl_grants_type_raises_error(self):
         """Should raise RuleInvalidSchema when acl_grants is not a list"""
-        snapshot = ResourceSnapshot(
-            snapshot_id="test-5",
-            account_id="123456789012",
-            provider=Provider.AWS,
-            resource_type=ResourceType.S3_BUCKET,
-            resource_id="bucket-5",
-            captured_at=datetime.now(timezone.utc),
-            metadata={"acl_grants": "not-a-list"},
-        )
+        snapshot = ResourceSnapshot.minimal(metadata={"acl_grants": "not-a-list"})
         with self.assertRaises(RuleInvalidSchema) as cm:
             self.rule.evaluate(snapshot)
         self.assertIn("must be a list", str(cm.exception))
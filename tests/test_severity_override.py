@@ -1,7 +1,7 @@
-import unittest
 from datetime import datetime, timezone
 
-from skywatch_policy_engine.builtins import default_registry
+import pytest
+
 from skywatch_policy_engine.engine import PolicyEngine
 from skywatch_policy_engine.repository import StaticPolicyRepository
 from skywatch_policy_engine.types import (
@@ -13,62 +13,61 @@ from skywatch_policy_engine.types import (
 )
 
 
-class TestSeverityOverride(unittest.TestCase):
-    def test_severity_override_applied(self):
-        """Should apply severity override from rule config"""
-        engine = PolicyEngine(
-            repository=StaticPolicyRepository(
-                tuple(
-                    [
-                        RuleConfig(
-                            rule_id="S3_ENCRYPTION_DISABLED",
-                            enabled=True,
-                            severity_override=Severity.CRITICAL,  # Override HIGH to CRITICAL
-                        )
-                    ]
-                )
-            ),
-            registry=default_registry(),
-        )
-        snapshot = ResourceSnapshot(
-            snapshot_id="test-1",
-            account_id="123456789012",
-            provider=Provider.AWS,
-            resource_type=ResourceType.S3_BUCKET,
-            resource_id="bucket-1",
-            captured_at=datetime.now(timezone.utc),
-            metadata={"encryption": {"enabled": False}},
-        )
-        result = engine.evaluate(snapshot)
-        # Find the encryption finding
-        encryption_findings = [
-            f for f in result.findings if f.rule_id == "S3_ENCRYPTION_DISABLED"
-        ]
-        self.assertEqual(len(encryption_findings), 1)
-        # Should be CRITICAL due to override, not HIGH (default)
-        self.assertEqual(encryption_findings[0].severity, Severity.CRITICAL)
-
-    def test_default_severity_when_no_override(self):
-        """Should use default severity when no override is set"""
-        engine = PolicyEngine(
-            repository=StaticPolicyRepository(
-                tuple([RuleConfig(rule_id="S3_ENCRYPTION_DISABLED", enabled=True)])
-            ),
-            registry=default_registry(),
-        )
-        snapshot = ResourceSnapshot(
-            snapshot_id="test-2",
-            account_id="123456789012",
-            provider=Provider.AWS,
-            resource_type=ResourceType.S3_BUCKET,
-            resource_id="bucket-2",
-            captured_at=datetime.now(timezone.utc),
-            metadata={"encryption": {"enabled": False}},
-        )
-        result = engine.evaluate(snapshot)
-        encryption_findings = [
-            f for f in result.findings if f.rule_id == "S3_ENCRYPTION_DISABLED"
-        ]
-        self.assertEqual(len(encryption_findings), 1)
-        # Should be HIGH (default for EncryptionEnabledRule)
-        self.assertEqual(encryption_findings[0].severity, Severity.HIGH)
+# Timestamps are never asserted; a fixed value avoids a clock read per test.
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# RuleConfig is frozen, so the two variants under test are module constants.
+_CFG_OVERRIDE = RuleConfig(
+    rule_id="S3_ENCRYPTION_DISABLED",
+    enabled=True,
+    severity_override=Severity.CRITICAL,  # Override HIGH to CRITICAL
+)
+_CFG_DEFAULT = RuleConfig(rule_id="S3_ENCRYPTION_DISABLED", enabled=True)
+
+
+def _snapshot(resource_id):
+    return ResourceSnapshot(
+        snapshot_id=resource_id,
+        account_id="123456789012",
+        provider=Provider.AWS,
+        resource_type=ResourceType.S3_BUCKET,
+        resource_id=resource_id,
+        captured_at=_NOW,
+        metadata={"encryption": {"enabled": False}},
+    )
+
+
+def _engine(registry, cfg):
+    return PolicyEngine(
+        repository=StaticPolicyRepository((cfg,)),
+        registry=registry,
+    )
+
+
+# Each config variant is evaluated once per module; tests only assert on the
+# severity mapping of the shared result.
+@pytest.fixture(scope="module")
+def override_result(registry):
+    return _engine(registry, _CFG_OVERRIDE).evaluate(_snapshot("bucket-1"))
+
+
+@pytest.fixture(scope="module")
+def default_result(registry):
+    return _engine(registry, _CFG_DEFAULT).evaluate(_snapshot("bucket-2"))
+
+
+def test_severity_override_applied(override_result):
+    """Should apply severity override from rule config"""
+    # Find the encryption finding
+    encryption_findings = override_result.findings_by_rule("S3_ENCRYPTION_DISABLED")
+    assert len(encryption_findings) == 1
+    # Should be CRITICAL due to override, not HIGH (default)
+    assert encryption_findings[0].severity is Severity.CRITICAL
+
+
+def test_default_severity_when_no_override(default_result):
+    """Should use default severity when no override is set"""
+    encryption_findings = default_result.findings_by_rule("S3_ENCRYPTION_DISABLED")
+    assert len(encryption_findings) == 1
+    # Should be HIGH (default for EncryptionEnabledRule)
+    assert encryption_findings[0].severity is Severity.HIGH